@@ -4,7 +4,7 @@ Shopping Cart Implementation - Solution
 This is a complete implementation of the ShoppingCart class that passes all tests.
 """
 
-from decimal import Decimal, ROUND_HALF_UP
+from sys import intern
 
 
 class ShoppingCart:
@@ -12,12 +12,43 @@ class ShoppingCart:
 
     TAX_RATE = 0.085  # 8.5% tax rate
 
+    # Integer-math constants, built once at class definition so the hot
+    # paths never reconstruct them (with Decimal these were per-call
+    # Decimal(str(...)) constructions; as ints they are named scales)
+    _TAX_MULT_MILLI = 1085  # (1 + TAX_RATE) * 1000
+    _BASIS_POINTS = 10000   # basis points in 100%
+    _MILLI = 1000           # milli-units per unit
+    _HALF_MILLI = 500       # half a milli-unit, for half-up rounding
+
+    # Fixed attribute layout: no per-instance __dict__, and attribute
+    # access is an offset load instead of a dict probe
+    # get_total is a slot, not a method: __init__ and apply_discount bind
+    # it to the kernel specialized for the current discount state
+    __slots__ = ('items', 'get_total', '_discount_kind', '_discount_value',
+                 '_discount_code', '_subtotal_scaled')
+
+    # Discount kinds, stored as ints so get_total branches on an integer
+    # compare instead of string equality
+    _DISCOUNT_NONE = 0
+    _DISCOUNT_PERCENTAGE = 1
+    _DISCOUNT_FIXED = 2
+
     def __init__(self):
         """Initialize an empty shopping cart."""
-        # Use a dictionary to store items: {name: {'price': float, 'quantity': float}}
+        # Use a dictionary to store items, with money and quantities held as
+        # scaled integers to keep all arithmetic exact:
+        # {name: (price_cents, quantity_milli)}
         self.items = {}
-        # Store discount information as a dict: {'type': str, 'value': float}
-        self.discount = None
+        # Store discount information as scalars rather than a dict
+        self._discount_kind = self._DISCOUNT_NONE
+        self._discount_value = 0
+        self._discount_code = None
+        # Start on the no-discount fast path; apply_discount rebinds
+        self.get_total = self._total_no_discount
+        # Running subtotal in milli-cents, kept in sync by add_item and
+        # remove_item so reads never have to walk the items; integer
+        # accumulation stays exact no matter the order of mutations
+        self._subtotal_scaled = 0
 
     def add_item(self, name: str, price: float, quantity: float) -> None:
         """
@@ -31,21 +62,37 @@ class ShoppingCart:
         Raises:
             ValueError: If price is negative or quantity is <= 0
         """
-        # Validate inputs
+        # Validate inputs: one fused check on the happy path, with the
+        # raise outlined into a cold helper
+        if price < 0 or quantity <= 0:
+            self._raise_bad_inputs(price, quantity)
+
+        # Intern the name so repeated adds of the same item hit the dict
+        # with an identity-equal key (pointer compare, no full equality)
+        name = intern(name)
+
+        # Scale to integers up front: cents for money, milli-units for
+        # quantity (supports fractional quantities like 2.5 kg)
+        price_cents = round(price * 100)
+        quantity_milli = round(quantity * 1000)
+
+        # If item already exists, add to existing quantity (the original
+        # price is kept, so the subtotal delta uses the stored price)
+        existing = self.items.get(name)
+        if existing is not None:
+            price_cents = existing[0]
+            total_milli = existing[1] + quantity_milli
+        else:
+            total_milli = quantity_milli
+        self._subtotal_scaled += price_cents * quantity_milli
+        self.items[name] = (price_cents, total_milli)
+
+    @staticmethod
+    def _raise_bad_inputs(price: float, quantity: float) -> None:
+        """Raise the appropriate ValueError for invalid add_item inputs."""
         if price < 0:
             raise ValueError("Price cannot be negative")
-        if quantity <= 0:
-            raise ValueError("Quantity must be greater than zero")
-
-        # If item already exists, add to existing quantity
-        if name in self.items:
-            self.items[name]['quantity'] += quantity
-        else:
-            # Create new item entry
-            self.items[name] = {
-                'price': price,
-                'quantity': quantity
-            }
+        raise ValueError("Quantity must be greater than zero")
 
     def remove_item(self, name: str) -> None:
         """
@@ -55,7 +102,10 @@ class ShoppingCart:
             name: The name of the item to remove
         """
         # Use pop with default None to silently handle missing items
-        self.items.pop(name, None)
+        # (interned to match the keys stored by add_item)
+        item = self.items.pop(intern(name), None)
+        if item is not None:
+            self._subtotal_scaled -= item[0] * item[1]
 
     def get_item_count(self) -> int:
         """
@@ -66,15 +116,6 @@ class ShoppingCart:
         """
         return len(self.items)
 
-    def _calculate_raw_subtotal(self) -> float:
-        """
-        Calculate the raw subtotal without rounding (internal use).
-
-        Returns:
-            The raw subtotal as a float
-        """
-        return sum(item['price'] * item['quantity'] for item in self.items.values())
-
     def get_subtotal(self) -> float:
         """
         Calculate the subtotal (before tax and discounts).
@@ -82,7 +123,13 @@ class ShoppingCart:
         Returns:
             The subtotal rounded to 2 decimal places
         """
-        return round(self._calculate_raw_subtotal(), 2)
+        # Empty carts are common (totals get recomputed before anything
+        # is added), so skip the arithmetic entirely
+        if not self.items:
+            return 0.0
+        # One attribute read and a half-up division from milli-cents to
+        # cents — no round() call, no method call, no item scan
+        return (self._subtotal_scaled + self._HALF_MILLI) // self._MILLI / 100
 
     def apply_discount(self, code: str, discount_type: str, value: float) -> None:
         """
@@ -93,14 +140,40 @@ class ShoppingCart:
             discount_type: Either "percentage" or "fixed"
             value: The discount value (percentage or fixed amount)
         """
-        # Store discount (most recent wins)
-        self.discount = {
-            'code': code,
-            'type': discount_type,
-            'value': value
-        }
-
-    def get_total(self) -> float:
+        # Store discount (most recent wins), normalizing everything once so
+        # get_total only does integer math: the type becomes an int kind and
+        # percentages become basis points, fixed amounts become cents.
+        # Unknown discount types are ignored.
+        if discount_type == 'percentage':
+            self._discount_kind = self._DISCOUNT_PERCENTAGE
+        elif discount_type == 'fixed':
+            self._discount_kind = self._DISCOUNT_FIXED
+        else:
+            self._discount_kind = self._DISCOUNT_NONE
+        self._discount_value = round(value * 100)
+        self._discount_code = code
+        # Pick the get_total kernel matching the new discount state
+        if self._discount_kind:
+            self.get_total = self._total_with_discount
+        else:
+            self.get_total = self._total_no_discount
+
+    def _total_no_discount(self) -> float:
+        """
+        Calculate the total cost with tax (no-discount fast path).
+
+        Returns:
+            The final total rounded to 2 decimal places
+        """
+        # Empty cart: nothing to tax
+        if not self.items:
+            return 0.0
+        # Most carts are totalled many times before any discount exists,
+        # so this kernel skips the discount branch entirely
+        total = self._subtotal_scaled * self._TAX_MULT_MILLI // self._MILLI
+        return (total + self._HALF_MILLI) // self._MILLI / 100
+
+    def _total_with_discount(self) -> float:
         """
         Calculate the total cost after discounts and tax.
 
@@ -114,28 +187,29 @@ class ShoppingCart:
             4. Apply tax to the discounted amount
             5. Round to 2 decimal places
         """
-        # Use Decimal for precise calculations to avoid floating point errors
-        subtotal = Decimal(str(self._calculate_raw_subtotal()))
-
-        # Apply discount if one exists
-        if self.discount:
-            if self.discount['type'] == 'percentage':
-                # Percentage discount: reduce by percentage
-                discount_value = Decimal(str(self.discount['value']))
-                discount_amount = subtotal * (discount_value / Decimal('100'))
-                subtotal -= discount_amount
-            elif self.discount['type'] == 'fixed':
-                # Fixed discount: reduce by fixed amount
-                subtotal -= Decimal(str(self.discount['value']))
+        # Empty cart: whatever the discount, the clamped total is zero
+        if not self.items:
+            return 0.0
+
+        # All math happens on integers scaled by 100,000, so there are no
+        # floating point errors to correct for
+        subtotal = self._subtotal_scaled
+
+        # Apply discount
+        kind = self._discount_kind
+        if kind == self._DISCOUNT_PERCENTAGE:
+            # Percentage discount: value is in basis points
+            subtotal -= subtotal * self._discount_value // self._BASIS_POINTS
+        elif kind == self._DISCOUNT_FIXED:
+            # Fixed discount: value is in cents, rescale to match
+            subtotal -= self._discount_value * self._MILLI
 
         # Ensure total doesn't go below 0
         if subtotal < 0:
-            subtotal = Decimal('0')
+            subtotal = 0
 
-        # Apply tax
-        tax_rate = Decimal(str(self.TAX_RATE))
-        total = subtotal * (Decimal('1') + tax_rate)
+        # Apply tax (8.5% as the integer ratio 1085/1000)
+        total = subtotal * self._TAX_MULT_MILLI // self._MILLI
 
-        # Round to 2 decimal places using ROUND_HALF_UP
-        rounded_total = total.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
-        return float(rounded_total)
+        # Round half-up to cents and convert to dollars
+        return (total + self._HALF_MILLI) // self._MILLI / 100